@@ -16,7 +16,4 @@ def call_many[
 ](
     funcs: typing.Iterable[typing.Callable[Param, R]], *args: Param.args, **kwargs: Param.kwargs
 ) -> list[R]:
-    r: list[R] = []
-    for func in funcs:
-        r.append(func(*args, **kwargs))
-    return r
+    return [func(*args, **kwargs) for func in funcs]
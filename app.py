@@ -2,9 +2,19 @@ import pygame
 import typing
 from fakeengine.input.devices import HardwareWrapper
 
+# events that change the window size, always let through so App.width and App.height stay current
+_RESIZE_EVENTS = (pygame.VIDEORESIZE, pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED)
+
 class Scene:
     """Represents a page in the application, containing nodes for rendering."""
 
+    __slots__ = ("app",)
+
+    # The event types this scene handles. When set, every other event type is
+    # blocked at the SDL level while the scene is active, so it never reaches the queue.
+    # None lets every event through.
+    event_types: typing.Collection[int] | None = None
+
     def __init__(self, app: "App") -> None:
         """
         Initializes a new Scene instance.
@@ -76,23 +86,25 @@ class App:
 
         self.running = False
         self.screen = pygame.display.set_mode((width, height), flags=flags)
+        # cached window size, kept in sync on resize events
+        self._width, self._height = pygame.display.get_window_size()
         pygame.display.set_caption(caption)
 
         self.clear_color = clear_color
         self.clock = pygame.time.Clock()
         self.scene: Scene | None = None
+        # set while a scene's event_types filter is installed, so it is only undone when there is one
+        self._filtering_events = False
 
     @property
     def height(self) -> int:
         """Returns the screen height"""
-        size = pygame.display.get_window_size()
-        return size[1]
+        return self._height
 
     @property
     def width(self) -> int:
         """Returns the screen width"""
-        size = pygame.display.get_window_size()
-        return size[0]
+        return self._width
 
     def run(self, delta: float):
         """Ran in a loop"""
@@ -102,7 +114,10 @@ class App:
     def handle_event(self, event: pygame.Event) -> typing.Literal[-1] | None:
         """Handle one event"""
         HardwareWrapper.sync_all(event)
-        
+
+        if event.type in _RESIZE_EVENTS:
+            self._width, self._height = pygame.display.get_window_size()
+
         if self.scene:
             return self.scene.handle_event(event)
         return None
@@ -124,29 +139,63 @@ class App:
 
         scene = typing.cast(Scene, scene)
 
+        # install the scene's event filter before init, so blocks made in init are kept
+        self.filter_events(scene.event_types)
+
         # run initialisation
         scene.init(self, **kwargs)
         self.scene = scene
 
+    def filter_events(self, event_types: typing.Collection[int] | None):
+        """
+        Restricts the event queue to the given event types.
+
+        Parameters:
+            event_types (Collection[int] | None): The event types to allow, or None to remove
+                a filter installed here. The SDL filter isn't touched otherwise, so blocks made
+                with pygame.event.set_blocked are kept. QUIT, window resizes and the events
+                hardware devices declare in HANDLED_TYPES are always allowed.
+        """
+        if event_types is None:
+            if self._filtering_events:
+                pygame.event.set_allowed(None)
+                self._filtering_events = False
+            return
+
+        self._filtering_events = True
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [pygame.QUIT, *_RESIZE_EVENTS, *HardwareWrapper.__dispatch__, *event_types]
+        )
+
     def mainloop(self):
         """Starts the main loop of the application."""
         self.running = True
 
+        # bind the per frame calls once, instead of resolving them every frame
+        get_events = pygame.event.get
+        flip = pygame.display.flip
+        tick = self.clock.tick
+        fill = self.screen.fill
+        handle_event = self.handle_event
+        run = self.run
+
         try:
             while self.running:
                 # clear the screen
-                self.screen.fill(self.clear_color)
+                # clear_color is still read every frame so it can be changed while running
+                fill(self.clear_color)
 
                 # event loop
-                for event in pygame.event.get():
-                    if self.handle_event(event) == -1:
+                for event in get_events():
+                    if handle_event(event) == -1:
                         break
 
                 # frame rate limiting
-                delta = self.clock.tick(60) / 1000
+                delta = tick(60) / 1000
 
-                self.run(delta)
-                pygame.display.flip()
+                run(delta)
+                flip()
         except KeyboardInterrupt:
             print("Process interrupted by user.")
 
@@ -5,49 +5,79 @@ from pygame.sprite import Sprite
 from pygame import Vector2, Surface, FRect
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraSubject:
     subject: Sprite
-    last_position: Vector2
+    last_x: float
+    last_y: float
     bounding_rect: FRect | None = None
 
 
 class Camera(Group):
+    __slots__ = ("ox", "oy", "surface", "following")
+
     def __init__(self, surface: Surface, *sprites: Sprite):
         super().__init__(*sprites)
-        self.offset = Vector2()
+        # offset is kept as two floats so the per frame math allocates nothing,
+        # read and write these directly instead of going through offset
+        self.ox = 0.0
+        self.oy = 0.0
         self.surface = surface
 
         self.following: CameraSubject | None = None
 
+    @property
+    def offset(self) -> Vector2:
+        """
+        Returns a copy of the camera offset. Changing the copy in place
+        (offset.x = 5, offset.update(...)) does nothing, assign offset or set ox / oy instead.
+        """
+        return Vector2(self.ox, self.oy)
+
+    @offset.setter
+    def offset(self, value: Vector2 | tuple[float, float]):
+        self.ox, self.oy = value
+
     def follow(self, sprite: Sprite, center: bool = False):
         assert sprite.rect
-        self.offset = Vector2()
-        last_position = Vector2(sprite.rect.topleft)
+        self.ox = 0.0
+        self.oy = 0.0
+        last_x = sprite.rect.x
+        last_y = sprite.rect.y
 
         if center:
-            self.offset += (
-                Vector2(self.surface.get_width() / 2, self.surface.get_height() / 2)
-                - last_position
-            )
+            self.ox = self.surface.get_width() / 2 - last_x
+            self.oy = self.surface.get_height() / 2 - last_y
 
-        self.following = CameraSubject(subject=sprite, last_position=last_position)
+        self.following = CameraSubject(subject=sprite, last_x=last_x, last_y=last_y)
 
     def draw(self):
         # if following, auto calculate offset
-        if self.following:
-            subject = self.following.subject
-            assert subject.rect
-            self.offset -= Vector2(subject.rect.topleft) - self.following.last_position
-            self.following.last_position = Vector2(subject.rect.topleft)
+        following = self.following
+        if following:
+            rect = following.subject.rect
+            assert rect
+            x, y = rect.x, rect.y
+            self.ox -= x - following.last_x
+            self.oy -= y - following.last_y
+            following.last_x = x
+            following.last_y = y
 
-        for sprite in self.sprites():
-            rect: FRect | None = sprite.rect
+        # the area of the world the camera currently sees
+        ox, oy = self.ox, self.oy
+        view = FRect(-ox, -oy, self.surface.get_width(), self.surface.get_height())
 
+        # the image is drawn at full size from rect.topleft, so cull against the image's area there.
+        # A rect smaller than its image (e.g. a hitbox) still shows the part of the image on screen
+        blit_sequence = []
+        for sprite in self.sprites():
+            rect = sprite.rect
             if not rect:
                 continue
+            image = sprite.image
+            x, y = rect.x, rect.y
+            if view.colliderect(x, y, *image.get_size()):
+                blit_sequence.append((image, (x + ox, y + oy)))
 
-            new_rect = rect.copy()
-            new_rect.topleft += self.offset
-
-            self.surface.blit(sprite.image, new_rect)
+        # hand every visible sprite to pygame in a single blits call
+        self.surface.blits(blit_sequence, doreturn=False)
@@ -29,79 +29,98 @@ class BaseEventListenerMixin:
 
 class EventListenerMixin(BaseEventListenerMixin):
 
-    def _modifier_args_for_key_event(self, events: pygame.Event):
-        return dict(
-            ctrl=bool(pygame.key.get_mods() & pygame.KMOD_CTRL),
-            shift=bool(pygame.key.get_mods() & pygame.KMOD_SHIFT),
-            alt=bool(pygame.key.get_mods() & pygame.KMOD_ALT),
-            ctrl_l=bool(pygame.key.get_mods() & pygame.KMOD_LCTRL),
-            shift_l=bool(pygame.key.get_mods() & pygame.KMOD_LSHIFT),
-            alt_l=bool(pygame.key.get_mods() & pygame.KMOD_LALT),
-            ctrl_r=bool(pygame.key.get_mods() & pygame.KMOD_RCTRL),
-            shift_r=bool(pygame.key.get_mods() & pygame.KMOD_RSHIFT),
-            alt_r=bool(pygame.key.get_mods() & pygame.KMOD_RALT),
+    def _dispatch_mouse_motion(self, event: pygame.Event):
+        self.on_mouse_motion(
+            types.MouseMotionEvent(
+                pos=pygame.Vector2(event.pos),
+                rel=pygame.Vector2(event.rel),
+                buttons=event.buttons,
+                touch=event.touch,
+            ),
         )
 
+    def _dispatch_mouse_button_down(self, event: pygame.Event):
+        self.on_mouse_button_down(
+            types.MouseButtonDownEvent(
+                pos=pygame.Vector2(event.pos),
+                button=event.button,
+                touch=event.touch,
+            ),
+        )
+
+    def _dispatch_mouse_button_up(self, event: pygame.Event):
+        self.on_mouse_button_up(
+            types.MouseButtonUpEvent(
+                pos=pygame.Vector2(event.pos),
+                button=event.button,
+                touch=event.touch,
+            ),
+        )
+
+    def _dispatch_text_input(self, event: pygame.Event):
+        self.on_text_input(
+            types.TextInputEvent(
+                text=event.text,
+                mod_bits=pygame.key.get_mods(),
+            )
+        )
+
+    def _dispatch_key_down(self, event: pygame.Event):
+        self.on_key_down(
+            types.KeyDownEvent(
+                unicode=event.unicode,
+                key=event.key,
+                mod=event.mod,
+                scancode=event.scancode,
+                mod_bits=pygame.key.get_mods(),
+            )
+        )
+
+    def _dispatch_key_up(self, event: pygame.Event):
+        self.on_key_up(
+            types.KeyUpEvent(
+                unicode=event.unicode,
+                key=event.key,
+                mod=event.mod,
+                scancode=event.scancode,
+                mod_bits=pygame.key.get_mods(),
+            )
+        )
+
+    # event type -> (name of the user facing handler, dispatcher that builds its event)
+    _HANDLERS: dict[
+        int, tuple[str, typing.Callable[["EventListenerMixin", pygame.Event], None]]
+    ] = {
+        pygame.MOUSEMOTION: ("on_mouse_motion", _dispatch_mouse_motion),
+        pygame.MOUSEBUTTONDOWN: ("on_mouse_button_down", _dispatch_mouse_button_down),
+        pygame.MOUSEBUTTONUP: ("on_mouse_button_up", _dispatch_mouse_button_up),
+        pygame.TEXTINPUT: ("on_text_input", _dispatch_text_input),
+        pygame.KEYDOWN: ("on_key_down", _dispatch_key_down),
+        pygame.KEYUP: ("on_key_up", _dispatch_key_up),
+    }
+
+    # event type -> dispatcher, holding only the events the class actually overrides.
+    # Events missing here are only dispatched if the instance assigned its own handler.
+    _DISPATCH: dict[int, typing.Callable[["EventListenerMixin", pygame.Event], None]] = {}
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # specialise the table for this class: handlers left as the no-op default get no entry
+        cls._DISPATCH = {
+            event_type: dispatch
+            for event_type, (name, dispatch) in EventListenerMixin._HANDLERS.items()
+            if getattr(cls, name) is not getattr(EventListenerMixin, name)
+        }
+
     def _listen(self, event: pygame.Event):
-        match event.type:
-            case pygame.MOUSEMOTION:
-                self.on_mouse_motion(
-                    types.MouseMotionEvent(
-                        pos=pygame.Vector2(event.pos),
-                        rel=pygame.Vector2(event.rel),
-                        buttons=event.buttons,
-                        touch=event.touch,
-                    ),
-                )
-
-            case pygame.MOUSEBUTTONDOWN:
-                self.on_mouse_button_down(
-                    types.MouseButtonDownEvent(
-                        pos=pygame.Vector2(event.pos),
-                        button=event.button,
-                        touch=event.touch,
-                    ),
-                )
-
-            case pygame.MOUSEBUTTONUP:
-                self.on_mouse_button_up(
-                    types.MouseButtonUpEvent(
-                        pos=pygame.Vector2(event.pos),
-                        button=event.button,
-                        touch=event.touch,
-                    ),
-                )
-
-            case pygame.TEXTINPUT:
-                self.on_text_input(
-                    types.TextInputEvent(
-                        text=event.text,
-                        **self._modifier_args_for_key_event(event),
-                    )
-                )
-
-            case pygame.KEYDOWN:
-                # print(event)
-                self.on_key_down(
-                    types.KeyDownEvent(
-                        unicode=event.unicode,
-                        key=event.key,
-                        mod=event.mod,
-                        scancode=event.scancode,
-                        **self._modifier_args_for_key_event(event),
-                    )
-                )
-
-            case pygame.KEYUP:
-                self.on_key_up(
-                    types.KeyUpEvent(
-                        unicode=event.unicode,
-                        key=event.key,
-                        mod=event.mod,
-                        scancode=event.scancode,
-                        **self._modifier_args_for_key_event(event),
-                    )
-                )
+        handler = self._DISPATCH.get(event.type)
+        if handler is None:
+            # a handler assigned on the instance (listener.on_key_down = fn) isn't in the class table
+            entry = self._HANDLERS.get(event.type)
+            if entry is None or entry[0] not in self.__dict__:
+                return
+            handler = entry[1]
+        handler(self, event)
 
     def on_mouse_motion(self, event: types.MouseMotionEvent): ...
     def on_mouse_button_down(self, event: types.MouseButtonDownEvent): ...
@@ -4,10 +4,24 @@ import typing
 
 class HardwareWrapper:
     __devices__: list[type["HardwareWrapper"]] = []
+    # event type -> sync functions of the devices that handle it
+    __dispatch__: dict[int, list[typing.Callable[[pygame.Event], None]]] = {}
+    # sync functions of the devices that don't declare HANDLED_TYPES, they get every event
+    __unfiltered__: list[typing.Callable[[pygame.Event], None]] = []
+
+    # The event types a device's sync should receive, None sends it every event
+    HANDLED_TYPES: list[int] | None = None
 
     def __init_subclass__(cls) -> None:
         HardwareWrapper.__devices__.append(cls)
 
+        if cls.HANDLED_TYPES is None:
+            HardwareWrapper.__unfiltered__.append(cls.sync)
+            return
+
+        for event_type in cls.HANDLED_TYPES:
+            HardwareWrapper.__dispatch__.setdefault(event_type, []).append(cls.sync)
+
     @staticmethod
     def sync(event: pygame.Event):
         pass
@@ -15,8 +29,11 @@ class HardwareWrapper:
     @staticmethod
     @typing.final
     def sync_all(event: pygame.Event):
-        for cls in HardwareWrapper.__devices__:
-            cls.sync(event)
+        for sync in HardwareWrapper.__dispatch__.get(event.type, ()):
+            sync(event)
+
+        for sync in HardwareWrapper.__unfiltered__:
+            sync(event)
 
 
 class Joystick(HardwareWrapper):
@@ -32,7 +49,7 @@ class Joystick(HardwareWrapper):
     """
 
     controllers: list["Joystick"] = []
-    controller_sync_events = [
+    HANDLED_TYPES = [
         pygame.JOYDEVICEADDED,
         pygame.JOYDEVICEREMOVED,
     ]
@@ -46,9 +63,6 @@ class Joystick(HardwareWrapper):
 
     @staticmethod
     def sync(event: pygame.Event):
-        if not (event.type in Joystick.controller_sync_events):
-            return
-
         # Handle hot plugging
         if event.type == pygame.JOYDEVICEADDED:
             unlinked_controller: Joystick | None = None
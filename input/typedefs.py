@@ -3,10 +3,54 @@ from dataclasses import dataclass
 
 
 class EventClass:
+    __slots__ = ()
     __event_name__: str
 
 
-@dataclass
+class ModifierEventClass(EventClass):
+    """Event carrying the modifier key state, as returned by pygame.key.get_mods()"""
+
+    __slots__ = ()
+    mod_bits: int
+
+    @property
+    def ctrl(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_CTRL)
+
+    @property
+    def shift(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_SHIFT)
+
+    @property
+    def alt(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_ALT)
+
+    @property
+    def ctrl_l(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_LCTRL)
+
+    @property
+    def shift_l(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_LSHIFT)
+
+    @property
+    def alt_l(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_LALT)
+
+    @property
+    def ctrl_r(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_RCTRL)
+
+    @property
+    def shift_r(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_RSHIFT)
+
+    @property
+    def alt_r(self) -> bool:
+        return bool(self.mod_bits & pygame.KMOD_RALT)
+
+
+@dataclass(slots=True)
 class MouseMotionEvent(EventClass):
     __event_name__ = "on_mouse_motion"
     pos: pygame.Vector2
@@ -15,7 +59,7 @@ class MouseMotionEvent(EventClass):
     touch: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MouseButtonDownEvent(EventClass):
     __event_name__ = "on_mouse_button_down"
     pos: pygame.Vector2
@@ -23,7 +67,7 @@ class MouseButtonDownEvent(EventClass):
     touch: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MouseButtonUpEvent(EventClass):
     __event_name__ = "on_mouse_button_up"
     pos: pygame.Vector2
@@ -31,52 +75,28 @@ class MouseButtonUpEvent(EventClass):
     touch: bool
 
 
-@dataclass
-class KeyDownEvent(EventClass):
+@dataclass(slots=True)
+class KeyDownEvent(ModifierEventClass):
     __event_name__ = "on_keydown"
     unicode: str
     key: int
     mod: int
     scancode: int
-    ctrl: bool
-    shift: bool
-    alt: bool
-    ctrl_l: bool
-    shift_l: bool
-    alt_l: bool
-    ctrl_r: bool
-    shift_r: bool
-    alt_r: bool
-
-
-@dataclass
-class KeyUpEvent(EventClass):
+    mod_bits: int
+
+
+@dataclass(slots=True)
+class KeyUpEvent(ModifierEventClass):
     __event_name__ = "on_keyup"
     unicode: str
     key: int
     mod: int
     scancode: int
-    ctrl: bool
-    shift: bool
-    alt: bool
-    ctrl_l: bool
-    shift_l: bool
-    alt_l: bool
-    ctrl_r: bool
-    shift_r: bool
-    alt_r: bool
-
-
-@dataclass
-class TextInputEvent(EventClass):
+    mod_bits: int
+
+
+@dataclass(slots=True)
+class TextInputEvent(ModifierEventClass):
     __event_name__ = "on_textinput"
     text: str
-    ctrl: bool
-    shift: bool
-    alt: bool
-    ctrl_l: bool
-    shift_l: bool
-    alt_l: bool
-    ctrl_r: bool
-    shift_r: bool
-    alt_r: bool
+    mod_bits: int
@@ -1,6 +1,7 @@
+import math
 import typing
 import pygame
-from .typedefs import Number, Polarity
+from .typedefs import Number, Polarity, Position
 from collections.abc import Iterator
 
 
@@ -26,6 +27,26 @@ def rectToCoordinates(
     )
 
 
+def rectsToCoordinates(
+    rects: typing.Iterable[pygame.Rect | pygame.FRect], padding: int = 1
+) -> list[typing.Sequence[typing.Sequence[float]]]:
+    """Same as rectToCoordinates, for many rects at once"""
+
+    # the padding offsets are the same for every rect, so work them out once
+    low = padding + 1
+    high = padding
+
+    return [
+        (
+            (x - low, y - low),
+            (x + w + high, y - low),
+            (x + w + high, y + h + high),
+            (x - low, y + h + high),
+        )
+        for x, y, w, h in rects
+    ]
+
+
 def relax(value: float, step: float) -> float:
     """reduce to zero"""
 
@@ -34,19 +55,153 @@ def relax(value: float, step: float) -> float:
         return 0
 
     # just remove the step from the value
-    # we're using the polarity to decide if we should remove or add to the value to get to zero
-    polarity = get_polarity(value)
-    return value - (step * polarity)
+    # copysign gives the step the value's sign, so we move towards zero without branching
+    return value - math.copysign(step, value)
+
+
+def relax_many(values: typing.Iterable[float], step: float) -> list[float]:
+    """reduce every value to zero by step, same as calling relax on each of them"""
+
+    # relax is inlined here so a batch doesn't pay for a function call per value
+    copysign = math.copysign
+    return [
+        0 if abs(value) < step else value - copysign(step, value) for value in values
+    ]
 
 
 def get_polarity(value: float) -> Polarity:
     return 1 if value > 0 else -1
 
 
+def _segments_intersect(
+    p1x: float,
+    p1y: float,
+    p2x: float,
+    p2y: float,
+    q1x: float,
+    q1y: float,
+    q2x: float,
+    q2y: float,
+) -> bool:
+    """Checks if the segment p1-p2 crosses the segment q1-q2.
+    Each side is a counter clockwise orientation test, inlined on raw floats for the collision loops.
+    """
+    return ((q2y - p1y) * (q1x - p1x) > (q1y - p1y) * (q2x - p1x)) != (
+        (q2y - p2y) * (q1x - p2x) > (q1y - p2y) * (q2x - p2x)
+    ) and ((q1y - p1y) * (p2x - p1x) > (p2y - p1y) * (q1x - p1x)) != (
+        (q2y - p1y) * (p2x - p1x) > (p2y - p1y) * (q2x - p1x)
+    )
+
+
+def _point_in_polygon(
+    px: float, py: float, xs: typing.Sequence[float], ys: typing.Sequence[float]
+) -> bool:
+    """Checks if the point is inside the polygon made by xs, ys (ray casting)"""
+    inside = False
+
+    # walk every edge, flipping on each one a ray going right from the point crosses
+    x1, y1 = xs[-1], ys[-1]
+    for x2, y2 in zip(xs, ys):
+        if (y1 > py) != (y2 > py) and px < (x2 - x1) * (py - y1) / (y2 - y1) + x1:
+            inside = not inside
+        x1, y1 = x2, y2
+
+    return inside
+
+
+def _project(
+    xs: typing.Sequence[float], ys: typing.Sequence[float], nx: float, ny: float
+) -> tuple[float, float]:
+    """Returns the (min, max) range of the points projected on the axis (nx, ny)"""
+    dots = [x * nx + y * ny for x, y in zip(xs, ys)]
+    return min(dots), max(dots)
+
+
+# the edge normals of an axis aligned rectangle
+_RECT_NORMALS = ((0.0, 1.0), (1.0, 0.0))
+
+
 class Polygon2D(Iterator):
+    __slots__ = ("_index", "_vectors", "_xs", "_ys", "_aabb", "_centroid", "_normals")
+
     def __init__(self, *vectors: pygame.Vector2) -> None:
         self._index = 0
-        self.vectors = vectors
+        self._vectors: tuple[pygame.Vector2, ...] | None = vectors
+        # the vertices as separate x and y coordinates, read by the collision checks
+        self._set_coordinates(tuple(v.x for v in vectors), tuple(v.y for v in vectors))
+
+    def _set_coordinates(self, xs: tuple[float, ...], ys: tuple[float, ...]):
+        """Stores the vertex coordinates along with their bounding box and centroid"""
+        self._xs = xs
+        self._ys = ys
+        # unique edge normals, worked out on first use by collides_convex
+        self._normals: tuple[tuple[float, float], ...] | None = None
+
+        # bounding box as (left, top, right, bottom), empty polygons overlap nothing
+        self._aabb = (
+            (min(xs), min(ys), max(xs), max(ys))
+            if xs
+            else (math.inf, math.inf, -math.inf, -math.inf)
+        )
+
+        # mean of the vertices
+        count = len(xs) or 1
+        self._centroid = (sum(xs) / count, sum(ys) / count)
+
+    @staticmethod
+    def _from_coordinates(xs: tuple[float, ...], ys: tuple[float, ...]) -> "Polygon2D":
+        """Creates a polygon straight from its coordinates, without building vectors"""
+        polygon = Polygon2D.__new__(Polygon2D)
+        polygon._index = 0
+        polygon._vectors = None
+        polygon._set_coordinates(xs, ys)
+        return polygon
+
+    @property
+    def vectors(self) -> tuple[pygame.Vector2, ...]:
+        """Returns the vertices, built from the cached coordinates on first access"""
+        if self._vectors is None:
+            self._vectors = tuple(pygame.Vector2(p) for p in zip(self._xs, self._ys))
+        return self._vectors
+
+    def _translated(self, dx: float, dy: float) -> "Polygon2D":
+        """Returns a copy moved by (dx, dy), shifting the cached data instead of rebuilding it"""
+        polygon = Polygon2D.__new__(Polygon2D)
+        polygon._index = 0
+        polygon._vectors = None
+        polygon._xs = tuple(x + dx for x in self._xs)
+        polygon._ys = tuple(y + dy for y in self._ys)
+
+        left, top, right, bottom = self._aabb
+        polygon._aabb = (left + dx, top + dy, right + dx, bottom + dy)
+        polygon._centroid = (self._centroid[0] + dx, self._centroid[1] + dy)
+        # moving a polygon doesn't turn its edges
+        polygon._normals = self._normals
+        return polygon
+
+    def _edge_normals(self) -> tuple[tuple[float, float], ...]:
+        """Returns the unit normals of the edges, without duplicates.
+        Parallel edges share an axis, so a rectangle only has two.
+        """
+        if self._normals is None:
+            normals: dict[tuple[float, float], None] = {}
+            xs, ys = self._xs, self._ys
+            x1, y1 = xs[-1], ys[-1]
+            for x2, y2 in zip(xs, ys):
+                nx, ny = y1 - y2, x2 - x1
+                x1, y1 = x2, y2
+
+                length = math.hypot(nx, ny)
+                if not length:
+                    continue
+
+                # point every normal the same way, so opposite edges give the same axis
+                if nx < 0 or (nx == 0 and ny < 0):
+                    nx, ny = -nx, -ny
+                normals[(round(nx / length, 9), round(ny / length, 9))] = None
+
+            self._normals = tuple(normals)
+        return self._normals
 
     @staticmethod
     def create_from_lines(
@@ -65,14 +220,123 @@ class Polygon2D(Iterator):
     @staticmethod
     def from_rect(rect: pygame.FRect | pygame.Rect) -> "Polygon2D":
         """Creates a polygon from a pygame rectangle"""
-        top_left = pygame.Vector2(rect.topleft)
-        top_right = pygame.Vector2(rect.topright)
-        bottom_right = pygame.Vector2(rect.bottomright)
-        bottom_left = pygame.Vector2(rect.bottomleft)
-        return Polygon2D(top_left, top_right, bottom_right, bottom_left)
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        # top left, top right, bottom right, bottom left
+        polygon = Polygon2D._from_coordinates(
+            (left, right, right, left), (top, top, bottom, bottom)
+        )
+        # an axis aligned rectangle only needs the x and y axes
+        polygon._normals = _RECT_NORMALS
+        return polygon
+
+    def collides_point(self, point: Position) -> bool:
+        """Checks if a point is inside the polygon (ray casting)"""
+        if not self._xs:
+            return False
+
+        px, py = point
+        return _point_in_polygon(px, py, self._xs, self._ys)
+
+    @property
+    def aabb(self) -> tuple[float, float, float, float]:
+        """Returns the polygon's bounding box as (left, top, right, bottom)"""
+        return self._aabb
+
+    def _aabb_overlaps(self, other: "Polygon2D") -> bool:
+        """Checks if the bounding boxes of two polygons overlap"""
+        left_a, top_a, right_a, bottom_a = self._aabb
+        left_b, top_b, right_b, bottom_b = other._aabb
+        return not (
+            right_a < left_b or right_b < left_a or bottom_a < top_b or bottom_b < top_a
+        )
+
+    def collides_polygon(self, other: "Polygon2D") -> bool:
+        """Checks if two polygons overlap. Works for concave polygons too,
+        use collides_convex when both polygons are known to be convex.
+        """
+        # cheap broadphase, disjoint bounding boxes can't collide
+        if not self._aabb_overlaps(other):
+            return False
+
+        xs_a, ys_a = self._xs, self._ys
+        xs_b, ys_b = other._xs, other._ys
+        if not xs_a or not xs_b:
+            return False
+
+        # one polygon has a vertex inside the other
+        if any(_point_in_polygon(x, y, xs_b, ys_b) for x, y in zip(xs_a, ys_a)) or any(
+            _point_in_polygon(x, y, xs_a, ys_a) for x, y in zip(xs_b, ys_b)
+        ):
+            return True
+
+        # or any of their edges cross
+        px1, py1 = xs_a[-1], ys_a[-1]
+        for px2, py2 in zip(xs_a, ys_a):
+            qx1, qy1 = xs_b[-1], ys_b[-1]
+            for qx2, qy2 in zip(xs_b, ys_b):
+                if _segments_intersect(px1, py1, px2, py2, qx1, qy1, qx2, qy2):
+                    return True
+                qx1, qy1 = qx2, qy2
+            px1, py1 = px2, py2
+
+        return False
+
+    def collides_convex(self, other: "Polygon2D") -> bool:
+        """Checks if two convex polygons overlap (separating axis theorem)"""
+        # cheap broadphase, disjoint bounding boxes can't collide
+        if not self._aabb_overlaps(other):
+            return False
+
+        xs_a, ys_a = self._xs, self._ys
+        xs_b, ys_b = other._xs, other._ys
+        if not xs_a or not xs_b:
+            return False
+
+        # the line between the centroids is the axis most likely to separate
+        # the polygons, so try it first and reject far apart pairs with one projection
+        ax = other._centroid[0] - self._centroid[0]
+        ay = other._centroid[1] - self._centroid[1]
+        if ax or ay:
+            min_a, max_a = _project(xs_a, ys_a, ax, ay)
+            min_b, max_b = _project(xs_b, ys_b, ax, ay)
+            if max_a < min_b or max_b < min_a:
+                return False
+
+        # the polygons are apart if their projections on any edge normal don't overlap.
+        # axes shared by both polygons are only tested once
+        for nx, ny in dict.fromkeys(self._edge_normals() + other._edge_normals()):
+            min_a, max_a = _project(xs_a, ys_a, nx, ny)
+            min_b, max_b = _project(xs_b, ys_b, nx, ny)
+            if max_a < min_b or max_b < min_a:
+                return False
+
+        return True
+
+    def collides_rect(self, rect: pygame.FRect | pygame.Rect) -> bool:
+        """Checks if the polygon overlaps a rectangle. The polygon is assumed to be convex"""
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+        # the rectangle's own axes are x and y, testing them is a bounding box check
+        left_a, top_a, right_a, bottom_a = self._aabb
+        if right_a < left or right < left_a or bottom_a < top or bottom < top_a:
+            return False
+
+        # then the polygon's axes, projecting the rectangle's corners without building a polygon
+        rect_xs = (left, right, right, left)
+        rect_ys = (top, top, bottom, bottom)
+        for nx, ny in self._edge_normals():
+            if (nx, ny) in _RECT_NORMALS:
+                continue
+
+            min_a, max_a = _project(self._xs, self._ys, nx, ny)
+            min_b, max_b = _project(rect_xs, rect_ys, nx, ny)
+            if max_a < min_b or max_b < min_a:
+                return False
+
+        return True
 
     def __len__(self):
-        return len(self.vectors)
+        return len(self._xs)
 
     def __getitem__(self, index):
         return self.vectors[index]
@@ -90,15 +354,91 @@ class Polygon2D(Iterator):
         return self.vectors.__repr__()
 
     def __add__(self, other: pygame.Vector2 | tuple[float, float]):
-        if not (type(other) in [pygame.Vector2, tuple]):
+        if not isinstance(other, (pygame.Vector2, tuple)):
             raise TypeError(
                 f"unsupported operand type(s) for +: 'Polygon2D' and '{type(other)}'"
             )
-        return Polygon2D(*[v.copy() + other for v in self.vectors])
+        dx, dy = other
+        return self._translated(dx, dy)
 
-    def __sub__(self, other: pygame.Vector2):
-        if not (type(other) in [pygame.Vector2, tuple]):
+    def __sub__(self, other: pygame.Vector2 | tuple[float, float]):
+        if not isinstance(other, (pygame.Vector2, tuple)):
             raise TypeError(
-                f"unsupported operand type(s) for +: 'Polygon2D' and '{type(other)}'"
+                f"unsupported operand type(s) for -: 'Polygon2D' and '{type(other)}'"
             )
-        return Polygon2D(*[v.copy() - other for v in self.vectors])
+        dx, dy = other
+        return self._translated(-dx, -dy)
+
+
+class SpatialHash[T]:
+    """
+    A uniform grid for broadphase collision queries.
+    Objects are stored in every cell their bounding box touches (e.g. Polygon2D.aabb),
+    so a query only looks at the objects sharing a cell with it instead of every object.
+    A cell a few times the size of a typical object (e.g. 4x4 tiles) works well.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        """
+        Initializes a new SpatialHash instance.
+
+        Parameters:
+            cell_size (float): The width and height of a grid cell.
+        """
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[T]] = {}
+
+    def _cells_for(
+        self, aabb: tuple[float, float, float, float]
+    ) -> Iterator[tuple[int, int]]:
+        """Yields the cells covered by a (left, top, right, bottom) box.
+        A box that isn't finite (e.g. the aabb of an empty Polygon2D) covers no cells.
+        """
+        size = self.cell_size
+        left, top, right, bottom = aabb
+        if not (
+            math.isfinite(left)
+            and math.isfinite(top)
+            and math.isfinite(right)
+            and math.isfinite(bottom)
+        ):
+            return
+        for cx in range(int(left // size), int(right // size) + 1):
+            for cy in range(int(top // size), int(bottom // size) + 1):
+                yield cx, cy
+
+    def insert(self, obj: T, aabb: tuple[float, float, float, float]):
+        """
+        Adds an object to every cell its bounding box touches.
+
+        Parameters:
+            obj (T): The object to store.
+            aabb (tuple[float, float, float, float]): The object's (left, top, right, bottom) box.
+        """
+        cells = self.cells
+        for cell in self._cells_for(aabb):
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [obj]
+            else:
+                bucket.append(obj)
+
+    def query(self, aabb: tuple[float, float, float, float]) -> Iterator[T]:
+        """
+        Yields each object sharing a cell with the box once. These are only candidates,
+        run a narrow phase check (e.g. Polygon2D.collides_convex) on them.
+
+        Parameters:
+            aabb (tuple[float, float, float, float]): The (left, top, right, bottom) box to look up.
+        """
+        seen: set[int] = set()
+        cells = self.cells
+        for cell in self._cells_for(aabb):
+            for obj in cells.get(cell, ()):
+                if id(obj) not in seen:
+                    seen.add(id(obj))
+                    yield obj
+
+    def clear(self):
+        """Removes every object, e.g. before rebuilding the grid for a new frame"""
+        self.cells.clear()
@@ -1,5 +1,8 @@
-import math
+import heapq
 import typing
+import functools
+import itertools
+import collections
 import pygame
 from fakeengine.app import Scene
 from fakeengine.typedefs import Factory
@@ -8,6 +11,8 @@ from fakeengine.typedefs import Factory
 class Node:
     """Represents a basic drawable element."""
 
+    __slots__ = ("pos",)
+
     def __init__(self, pos: tuple[float, float]) -> None:
         """
         Initializes a new Node instance.
@@ -37,7 +42,85 @@ class Node:
         """handle computations for this node"""
 
 
+# shared by every Text created without a font, opened on first use
+_DEFAULT_FONT: pygame.Font | None = None
+# whether _clear_font_caches is registered to run on the next pygame.quit
+_QUIT_HOOKED = False
+
+
+def _hook_quit():
+    """Registers _clear_font_caches with pygame.quit, which forgets it once it has run"""
+    global _QUIT_HOOKED
+    if not _QUIT_HOOKED:
+        pygame.register_quit(_clear_font_caches)
+        _QUIT_HOOKED = True
+
+
+def _get_default_font() -> pygame.Font:
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        _DEFAULT_FONT = pygame.font.SysFont("DejaVu Sans", 16)
+        _hook_quit()
+    return _DEFAULT_FONT
+
+
+# Labels, scores and counters are short and repeat across nodes and frames.
+# Joined multi line text (e.g. Logger output) runs past a few lines, is different after
+# every new line and would only push the short entries out, so it isn't cached.
+_CACHE_MAX_LENGTH = 256
+
+
+# The cache holds a reference to every font it has rendered with (up to maxsize entries),
+# so those fonts stay alive until their entries are evicted or the cache is cleared.
+# A font is mutable, so its style is part of the key (the style argument is only used for that)
+@functools.lru_cache(maxsize=512)
+def _render_cached(
+    font: pygame.Font,
+    style: tuple[bool, bool, bool, bool, float],
+    text: str,
+    rgba: tuple[int, ...],
+) -> pygame.Surface:
+    _hook_quit()
+    return font.render(text, True, rgba)
+
+
+def _clear_font_caches():
+    """Drops the cached default font and surfaces, pygame.quit makes them unusable
+    and a later App would get them back otherwise."""
+    global _DEFAULT_FONT, _QUIT_HOOKED
+    _DEFAULT_FONT = None
+    _render_cached.cache_clear()
+    _QUIT_HOOKED = False
+
+
+def _render_text(font: pygame.Font, text: str, rgba: tuple[int, ...]) -> pygame.Surface:
+    """Renders text, sharing the surface between every Text showing the same thing.
+    The returned surface may be shared, it must not be modified (set_alpha, fill, ...), copy it first.
+    """
+    if len(text) < _CACHE_MAX_LENGTH:
+        style = (
+            font.bold,
+            font.italic,
+            font.underline,
+            font.strikethrough,
+            font.point_size,
+        )
+        return _render_cached(font, style, text, rgba)
+    return font.render(text, True, rgba)
+
+
 class Text(Node):
+    __slots__ = (
+        "_text",
+        "_is_factory",
+        "_color",
+        "_rgba",
+        "_font",
+        "center",
+        "_cache_key",
+        "_cache_surf",
+    )
+
     def __init__(
         self,
         pos: tuple[float, float] = (0, 0),
@@ -47,17 +130,87 @@ class Text(Node):
         center: bool = False,
     ) -> None:
         super().__init__(pos)
+        # last rendered surface, and what a factory text rendered it from
+        self._cache_key: tuple[str, tuple[int, ...], pygame.Font] | None = None
+        self._cache_surf: pygame.Surface | None = None
+
         self.text = text
         self.color = color
-        self.font = font or pygame.font.SysFont("DejaVu Sans", 16)
+        self.font = font or _get_default_font()
         self.center = center
 
+    @property
+    def text(self) -> str | Factory[str] | None:
+        return self._text
+
+    @text.setter
+    def text(self, value: str | Factory[str] | None):
+        self._text = value
+        # resolved once here instead of calling callable() on every draw
+        self._is_factory = callable(value)
+        self._cache_surf = None
+
+    @property
+    def color(self) -> pygame.Color:
+        """The text color. Assign a new color to update it, changes made in place aren't picked up"""
+        return self._color
+
+    @color.setter
+    def color(self, value: pygame.Color):
+        # accept anything font.render does, e.g. (255, 0, 0) or "red"
+        color = pygame.Color(value)
+        self._color = color
+        # immutable copy, used for rendering and as part of the cache key
+        self._rgba = (color.r, color.g, color.b, color.a)
+        self._cache_surf = None
+
+    @property
+    def font(self) -> pygame.Font:
+        """The text font. After changing the font's style (bold, point_size, ...) assign it again
+        to update the text, changes made in place aren't picked up"""
+        return self._font
+
+    @font.setter
+    def font(self, value: pygame.Font):
+        self._font = value
+        self._cache_surf = None
+
     def draw(
         self, scene: "Scene", *, return_surf=False
     ) -> tuple[pygame.Surface, pygame.Vector2] | None:
-        if self.text:
-            text = self.text() if callable(self.text) else self.text
-            surf = self.font.render(text, True, self.color)
+        """
+        Draws the text on the scene's screen, or returns it when return_surf is set.
+
+        Parameters:
+            scene (Scene): The scene to draw the text on.
+            return_surf (bool): Return the surface and its position instead of drawing it.
+                The surface is shared with every Text showing the same text, color and font,
+                call .copy() on it before changing it (e.g. set_alpha for a fade).
+        """
+        if self._text:
+            source = self._text
+
+            if self._is_factory:
+                # a factory can return something new each frame,
+                # only rasterize again when its text changed
+                text = typing.cast(Factory[str], source)()
+                # nothing to draw, skip rendering a zero width surface
+                if not text:
+                    return None
+
+                rgba = self._rgba
+                key = (text, rgba, self._font)
+                if key != self._cache_key or self._cache_surf is None:
+                    self._cache_surf = _render_text(self._font, text, rgba)
+                    self._cache_key = key
+
+            # static text is rendered once, until text, color or font is reassigned
+            elif self._cache_surf is None:
+                self._cache_surf = _render_text(
+                    self._font, typing.cast(str, source), self._rgba
+                )
+
+            surf = self._cache_surf
 
             rect = surf.get_frect()
             rect.topleft = self.pos
@@ -72,6 +225,8 @@ class Text(Node):
 
 
 class Logger(Node):
+    __slots__ = ("cap", "header", "_header_lines", "logs", "_text", "text_node")
+
     INSTANCE: "Logger|None" = None
 
     def __init__(
@@ -85,10 +240,21 @@ class Logger(Node):
         super().__init__(pos)
         self.cap = cap
         self.header = header
-        self.logs: list[str] = (
+        self._header_lines: list[str] = (
             [header.capitalize(), f"+{'-'*len(header)}"] if header else []
         )
-        self.text_node = Text(pos, lambda: "\n".join(self.logs), font, color)
+        # newest first, the deque drops the oldest entry once the cap is reached
+        self.logs: collections.deque[str] = collections.deque(
+            maxlen=max(cap - len(self._header_lines), 0)
+        )
+        # joined text, rebuilt only after a new log comes in
+        self._text: str | None = None
+        self.text_node = Text(pos, self._get_text, font, color)
+
+    def _get_text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join([*self._header_lines, *self.logs])
+        return self._text
 
     @staticmethod
     def log(*args: str, sep=" "):
@@ -101,9 +267,8 @@ class Logger(Node):
 
         text = sep.join(args)
 
-        self.logs.insert(2 if self.header else 0, text)
-        if len(self.logs) > self.cap:
-            self.logs = self.logs[: self.cap]
+        self.logs.appendleft(text)
+        self._text = None
 
     def draw(
         self,
@@ -113,6 +278,8 @@ class Logger(Node):
 
 
 class Timer(Node):
+    __slots__ = ("_countdown", "timeout", "trigger", "single_shot", "_done")
+
     def __init__(
         self,
         timeout: float,
@@ -120,28 +287,127 @@ class Timer(Node):
         single_shot: bool = True,
     ) -> None:
         Node.__init__(self, (0, 0))
-        self.countdown: float = 0.0
+        self._countdown: float = 0.0
         self.timeout = timeout
         self.trigger = trigger
         self.single_shot = single_shot
+        # set once a single shot timer has fired
+        self._done = False
+
+    @property
+    def countdown(self) -> float:
+        return self._countdown
+
+    @countdown.setter
+    def countdown(self, value: float):
+        # a single shot timer is done while its countdown is past the timeout,
+        # so writing e.g. countdown = 0 re-arms one that has fired
+        self._countdown = value
+        self._done = self.single_shot and value >= self.timeout
 
     @property
     def active(self) -> bool:
-        return self.countdown < self.timeout or not self.single_shot
+        return not self._done
 
     def reset(self):
-        self.countdown = 0
+        self._countdown = 0
+        self._done = False
 
     def process(self, delta: float, scene: Scene):
-        if not self.active:
+        if self._done:
             return
 
-        self.countdown += delta
+        self._countdown += delta
 
-        if self.countdown >= self.timeout:
+        if self._countdown >= self.timeout:
             self.trigger()
 
             if self.single_shot:
-                self.countdown = math.inf
+                self._done = True
             else:
                 self.reset()
+
+
+class TimerScheduler:
+    """
+    Runs many timers from a single min-heap keyed by their deadline.
+    Each tick only touches the timers that are due, instead of calling process on every timer.
+    Timers added here are driven by the scheduler, don't also call their process.
+    """
+
+    __slots__ = ("time", "_heap", "_entries", "_counter")
+
+    def __init__(self) -> None:
+        """Initializes a new TimerScheduler instance."""
+        self.time: float = 0.0
+        # [deadline, insertion order, timer], the counter breaks ties so timers are never compared.
+        # A removed timer's entry stays in the heap with timer set to None and is dropped when popped,
+        # so add and remove are safe to call from a trigger while tick is running.
+        self._heap: list[list[typing.Any]] = []
+        # timer -> its live heap entry
+        self._entries: dict[Timer, list[typing.Any]] = {}
+        self._counter = itertools.count()
+
+    def _schedule(self, timer: Timer, deadline: float):
+        entry = [deadline, next(self._counter), timer]
+        self._entries[timer] = entry
+        heapq.heappush(self._heap, entry)
+
+    def add(self, timer: Timer):
+        """
+        Schedules a timer to fire timeout seconds from now.
+        Adding a timer that is already scheduled restarts it.
+
+        Parameters:
+            timer (Timer): The timer to schedule.
+        """
+        self.remove(timer)
+        timer.reset()
+        self._schedule(timer, self.time + timer.timeout)
+
+    def remove(self, timer: Timer):
+        """
+        Unschedules a timer. Does nothing if the timer isn't scheduled.
+
+        Parameters:
+            timer (Timer): The timer to remove.
+        """
+        entry = self._entries.pop(timer, None)
+        if entry is not None:
+            entry[2] = None
+
+    def tick(self, delta: float):
+        """
+        Advances the scheduler's clock and fires the timers that are due.
+
+        Parameters:
+            delta (float): The time elapsed since the last tick, in seconds.
+        """
+        self.time = now = self.time + delta
+        heap = self._heap
+        entries = self._entries
+        repeating: list[list[typing.Any]] = []
+
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            timer: Timer | None = entry[2]
+            if timer is None:
+                continue
+
+            timer.trigger()
+
+            # the trigger may have removed or re-added this timer
+            if entries.get(timer) is not entry:
+                continue
+
+            if timer.single_shot:
+                del entries[timer]
+                timer._done = True
+            else:
+                repeating.append(entry)
+
+        # rescheduled after the loop so a timer fires at most once per tick, like Timer.process
+        for entry in repeating:
+            timer = entry[2]
+            if timer is not None:
+                self._schedule(timer, entry[0] + timer.timeout)
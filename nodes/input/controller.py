@@ -3,7 +3,21 @@ import pygame
 import typing
 
 from fakeengine.nodes import Node
-from fakeengine.reactive import Signal, Ref
+from fakeengine.reactive import Signal
+
+
+# the event types a controller reacts to
+_JOY_EVENT_TYPES = frozenset(
+    {
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+        pygame.JOYDEVICEADDED,
+        pygame.JOYDEVICEREMOVED,
+        pygame.JOYHATMOTION,
+    }
+)
 
 
 class JoyStickAxis(typing.TypedDict):
@@ -24,6 +38,8 @@ class BaseController(Node):
         on_disconnected (Signal): A signal emitted when the controller is disconnected.
     """
 
+    __slots__ = ("index", "joystick", "on_connected", "on_disconnected")
+
     controllers: list["BaseController"] = []
 
     def __init__(self) -> None:
@@ -47,18 +63,7 @@ class BaseController(Node):
         Args:
             event (pygame.Event): The pygame event to handle.
         """
-        if not (
-            event.type
-            in [
-                pygame.JOYAXISMOTION,
-                pygame.JOYBALLMOTION,
-                pygame.JOYBUTTONDOWN,
-                pygame.JOYBUTTONUP,
-                pygame.JOYDEVICEADDED,
-                pygame.JOYDEVICEREMOVED,
-                pygame.JOYHATMOTION,
-            ]
-        ):
+        if event.type not in _JOY_EVENT_TYPES:
             return
 
         # Handle hot plugging
@@ -142,58 +147,11 @@ class Playstation4Controller(BaseController):
         # self.on_l2_pressed: Signal[Playstation4Controller, float] = Signal()
         # self.on_r2_pressed: Signal[Playstation4Controller, float] = Signal()
 
-        # Joystick values
-        self._joystick_hat_l_value_x: Ref[float] = Ref(0)
-        self._joystick_hat_l_value_y: Ref[float] = Ref(0)
-        self._joystick_hat_r_value_x: Ref[float] = Ref(0)
-        self._joystick_hat_r_value_y: Ref[float] = Ref(0)
+        # Joystick values, as left x, left y, right x, right y
+        self._stick_values: list[float] = [0, 0, 0, 0]
         self._lever_l_value: float = 0
         self._lever_x_value: float = 0
 
-        self._joystick_hat_l_value_x.watch(
-            lambda value: self.on_l_axis_changed.emit(
-                self,
-                {
-                    "x": value,
-                    "y": self._joystick_hat_l_value_y.value,
-                    "angle": math.atan2(self._joystick_hat_l_value_y.value, value),
-                },
-            )
-        )
-
-        self._joystick_hat_l_value_y.watch(
-            lambda value: self.on_l_axis_changed.emit(
-                self,
-                {
-                    "x": self._joystick_hat_l_value_x.value,
-                    "y": value,
-                    "angle": math.atan2(value, self._joystick_hat_l_value_x.value),
-                },
-            )
-        )
-
-        self._joystick_hat_r_value_x.watch(
-            lambda value: self.on_r_axis_changed.emit(
-                self,
-                {
-                    "x": value,
-                    "y": self._joystick_hat_r_value_y.value,
-                    "angle": math.atan2(self._joystick_hat_r_value_y.value, value),
-                },
-            )
-        )
-
-        self._joystick_hat_r_value_y.watch(
-            lambda value: self.on_r_axis_changed.emit(
-                self,
-                {
-                    "x": self._joystick_hat_r_value_x.value,
-                    "y": value,
-                    "angle": math.atan2(value, self._joystick_hat_r_value_x.value),
-                },
-            )
-        )
-
         self.on_l2_value_changed.connect(
             lambda _, value: setattr(self, "_lever_l_value", value)
         )
@@ -207,7 +165,7 @@ class Playstation4Controller(BaseController):
             0: (self.on_x_button_up, self.on_x_button_down),
             1: (self.on_circle_button_up, self.on_circle_button_down),
             2: (self.on_square_button_up, self.on_square_button_down),
-            3: (self.on_triangle_button_down, self.on_triangle_button_down),
+            3: (self.on_triangle_button_up, self.on_triangle_button_down),
             4: (self.on_share_button_up, self.on_share_button_down),
             5: (self.on_ps_button_up, self.on_ps_button_down),
             6: (self.on_option_button_up, self.on_option_button_down),
@@ -225,39 +183,55 @@ class Playstation4Controller(BaseController):
             15: (self.on_track_pad_button_up, self.on_track_pad_button_down),
         }
 
+        # event type -> handler, looked up once per controller event
+        self._event_dispatch: dict[int, typing.Callable[[pygame.Event], None]] = {
+            pygame.JOYBUTTONUP: self._on_button,
+            pygame.JOYBUTTONDOWN: self._on_button,
+            pygame.JOYAXISMOTION: self._on_axis,
+        }
+
     def handle_controller_event(self, event: pygame.Event):
         """Handles Playstation 4 controller events.
 
         Args:
             event (pygame.Event): The pygame event to handle.
         """
+        handler = self._event_dispatch.get(event.type)
+        if handler:
+            handler(event)
+
+    def _on_button(self, event: pygame.Event):
+        # the mapping holds (up, down), so a press picks index 1
+        signal = self._button_id_mapping[event.button][
+            event.type == pygame.JOYBUTTONDOWN
+        ]
+        signal.emit(self)
+
+    def _on_axis(self, event: pygame.Event):
+        axis: int = event.axis
+        value: float = round(event.value, 2)
+
+        if 0 <= axis < 4:
+            values = self._stick_values
+            # sticks report tiny changes constantly, only notify when the rounded value moved
+            if values[axis] == value:
+                return
+            values[axis] = value
+
+            # axes 0, 1 are the left stick and 2, 3 the right one
+            if axis < 2:
+                signal = self.on_l_axis_changed
+                x, y = values[0], values[1]
+            else:
+                signal = self.on_r_axis_changed
+                x, y = values[2], values[3]
+            signal.emit(self, {"x": x, "y": y, "angle": math.atan2(y, x)})
 
-        if event.type == pygame.JOYBUTTONUP:
-            signal = self._button_id_mapping[event.button][0]
-            signal.emit(self)
-
-        elif event.type == pygame.JOYBUTTONDOWN:
-            signal = self._button_id_mapping[event.button][1]
-            signal.emit(self)
-
-        if event.type == pygame.JOYAXISMOTION:
-            axis = typing.cast(int, event.axis)
-            value = typing.cast(float, event.value).__round__(2)
-
-            if axis in range(0, 4):
-                hat_axis = [
-                    self._joystick_hat_l_value_x,
-                    self._joystick_hat_l_value_y,
-                    self._joystick_hat_r_value_x,
-                    self._joystick_hat_r_value_y,
-                ]
-                hat_axis[axis].value = value
-
-            elif axis == 4:
-                self.on_l2_value_changed.emit(self, value)
+        elif axis == 4:
+            self.on_l2_value_changed.emit(self, value)
 
-            elif axis == 5:
-                self.on_r2_value_changed.emit(self, value)
+        elif axis == 5:
+            self.on_r2_value_changed.emit(self, value)
 
     # def process(self, delta: float, scene: Scene) -> None:
     #     if self._lever_l_value > Playstation4Controller.LEVER_THRESHOLD:
@@ -14,20 +14,27 @@ class KeyboardData(typing.TypedDict):
 class Keyboard(Node):
     """A class for key board"""
 
+    __slots__ = ("on_key_up", "on_key_down")
+
     def __init__(self) -> None:
         super().__init__(pos=(0, 0))
         self.on_key_up: Signal[str, KeyboardData] = Signal()
         self.on_key_down: Signal[str, KeyboardData] = Signal()
 
     def handle_event(self, event: pygame.Event):
-        handler = {pygame.KEYDOWN: self.on_key_down, pygame.KEYUP: self.on_key_up}
-        if event.type in [pygame.KEYDOWN, pygame.KEYUP]:
-            handler[event.type].emit(
-                event.unicode,
-                {
-                    "key": event.key,
-                    "unicode": event.unicode,
-                    "scancode": event.scancode,
-                    "pg_event": event,
-                },
-            )
+        if event.type == pygame.KEYDOWN:
+            signal = self.on_key_down
+        elif event.type == pygame.KEYUP:
+            signal = self.on_key_up
+        else:
+            return
+
+        signal.emit(
+            event.unicode,
+            {
+                "key": event.key,
+                "unicode": event.unicode,
+                "scancode": event.scancode,
+                "pg_event": event,
+            },
+        )
@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 import typing
-import pydantic
+from dataclasses import dataclass, field
 
 
 class Signal[**Param]:
@@ -10,6 +12,8 @@ class Signal[**Param]:
         name (str, optional): The name of the signal (for identification purposes).
     """
 
+    __slots__ = ("_callbacks",)
+
     def __init__(self, name: str | None = None) -> None:
         """
         Initializes a new Signal instance.
@@ -17,7 +21,18 @@ class Signal[**Param]:
         Args:
             name (str, optional): The name of the signal.
         """
-        self.callbacks: list[typing.Callable[Param, typing.Any]] = []
+        # kept as a tuple so emit iterates a snapshot that connect/disconnect replace
+        self._callbacks: tuple[typing.Callable[Param, typing.Any], ...] = ()
+
+    @property
+    def callbacks(self) -> tuple[typing.Callable[Param, typing.Any], ...]:
+        """
+        The connected callbacks, in connection order.
+
+        Returns:
+            tuple[Callable, ...]: The connected callbacks.
+        """
+        return self._callbacks
 
     def emit(self, *args: Param.args, **kwargs: Param.kwargs):
         """
@@ -28,7 +43,17 @@ class Signal[**Param]:
             **kwargs: Arbitrary keyword arguments.
         """
 
-        for cb in self.callbacks:
+        callbacks = self._callbacks
+
+        # most signals have none or a single callback, skip the loop for those
+        count = len(callbacks)
+        if count == 0:
+            return
+        if count == 1:
+            callbacks[0](*args, **kwargs)
+            return
+
+        for cb in callbacks:
             cb(*args, **kwargs)
 
     def connect(self, cb: typing.Callable[Param, typing.Any]):
@@ -39,7 +64,7 @@ class Signal[**Param]:
             cb (Callable): The callback function to connect.
         """
 
-        self.callbacks.append(cb)
+        self._callbacks = self._callbacks + (cb,)
 
     def disconnect(self, cb: typing.Callable[Param, typing.Any]):
         """
@@ -49,8 +74,9 @@ class Signal[**Param]:
             cb (Callable): The callback function to disconnect.
         """
 
-        index = self.callbacks.index(cb)
-        del self.callbacks[index]
+        callbacks = list(self._callbacks)
+        callbacks.remove(cb)
+        self._callbacks = tuple(callbacks)
 
 
 class Ref[T]:
@@ -62,7 +88,10 @@ class Ref[T]:
         watch (Callable): A shortcut to connect a callback to value change events.
     """
 
-    class MethodCall(pydantic.BaseModel):
+    __slots__ = ("__raw__", "signal", "watch")
+
+    @dataclass(slots=True, frozen=True)
+    class MethodCall:
         """
         A data model representing a method call to be applied to the referenced value.
 
@@ -74,8 +103,8 @@ class Ref[T]:
         """
 
         name: str
-        args: tuple = pydantic.Field(default_factory=tuple)
-        kwargs: dict[str, typing.Any] = pydantic.Field(default_factory=dict)
+        args: tuple = ()
+        kwargs: dict[str, typing.Any] = field(default_factory=dict)
         use_return_value: bool = False
 
     def __init__(self, value: T) -> None:
@@ -111,6 +140,30 @@ class Ref[T]:
         self.__raw__ = v
         self.signal.emit(self.__raw__)
 
+    def set_value(self, v: T) -> None:
+        """
+        Updates the referenced value and notifies the watchers. Same as assigning to value.
+
+        Args:
+            v (T): The new value of the reference.
+        """
+        self.__raw__ = v
+        self.signal.emit(v)
+
+    def apply(self, method_call: MethodCall) -> None:
+        """
+        Calls a method on the referenced value and notifies the watchers.
+
+        Args:
+            method_call (MethodCall): The method to call, and whether its return value becomes the new value.
+        """
+        func = typing.cast(typing.Callable, getattr(self.__raw__, method_call.name))
+        return_value = func(*method_call.args, **method_call.kwargs)
+
+        if method_call.use_return_value:
+            self.__raw__ = return_value
+        self.signal.emit(self.__raw__)
+
     @typing.overload
     def mutate(self, val_or_method: T) -> None: ...
     @typing.overload
@@ -119,22 +172,15 @@ class Ref[T]:
     def mutate(self, val_or_method):
         """
         Mutates the referenced value. It can accept either a new value directly or a MethodCall object representing a method to be applied to the value.
+        When the kind of mutation is known up front, call set_value or apply directly instead.
 
         Args:
             val_or_method (Union[T, MethodCall]): The value or method to apply to the reference.
         """
         if type(val_or_method) is Ref.MethodCall:
-            func = typing.cast(
-                typing.Callable, getattr(self.__raw__, val_or_method.name)
-            )
-            return_value = func(*val_or_method.args, **val_or_method.kwargs)
-
-            if val_or_method.use_return_value:
-                self.value = return_value
-            else:
-                self.signal.emit(self.value)
-            return
-        self.value = val_or_method
+            self.apply(val_or_method)
+        else:
+            self.set_value(val_or_method)
 
     def __repr__(self) -> str:
         return f"Ref<{repr(self.value)}>"